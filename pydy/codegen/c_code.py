@@ -156,6 +156,29 @@ void evaluate(
             f.write(source)
 
 
+def _cse_symbolic_lusolve(exprs, prefix='pydy_'):
+    """Returns the replacements and reduced expressions of exprs, where the
+    second expression is replaced by the symbolic solution x of the linear
+    system Ax=b formed by the first two. A and b are cse'd before the
+    solution is found and the solution is cse'd again."""
+
+    gen1 = sm.numbered_symbols(prefix)
+    subexprs1, exprs_simp = sm.cse(exprs, symbols=gen1)
+
+    A_simp = exprs_simp[0]
+    b_simp = exprs_simp[1]
+
+    x = A_simp.LUsolve(b_simp)
+
+    gen2 = sm.numbered_symbols(prefix, start=len(subexprs1))
+    subexprs2, x_simp = sm.cse(x, symbols=gen2)
+
+    # swap the b matrix with the x result
+    exprs_simp[1] = x_simp[0]
+
+    return subexprs1 + subexprs2, exprs_simp
+
+
 class _CLUsolveGenerator(CMatrixGenerator):
     """This is a private undocumented class that supports the
     ``linear_sys_solver='sympy'`` in CythonMatrixGenerator. It cse's A and b of
@@ -167,19 +190,8 @@ class _CLUsolveGenerator(CMatrixGenerator):
         # NOTE : This assumes the first two items in self.matrices are A and b
         # of and Ax=b system. This also ignores cse=False.
 
-        gen1 = sm.numbered_symbols(prefix)
-        subexprs1, mats_simp = sm.cse(self.matrices, symbols=gen1)
-
-        A_simp = mats_simp[0]
-        b_simp = mats_simp[1]
-
-        x = A_simp.LUsolve(b_simp)
-
-        gen2 = sm.numbered_symbols(prefix, start=len(subexprs1))
-        subexprs2, x_simp = sm.cse(x, symbols=gen2)
-
-        # swap the b matrix with the x result
-        mats_simp[1] = x_simp[0]
+        subexprs, mats_simp = _cse_symbolic_lusolve(self.matrices,
+                                                    prefix=prefix)
 
-        self.subexprs = subexprs1 + subexprs2
+        self.subexprs = subexprs
         self.simplified_matrices = tuple(mats_simp)
@@ -3,12 +3,13 @@
 import os
 import sys
 import shutil
+import hashlib
 import tempfile
 import importlib
 import subprocess
 from collections import defaultdict
 
-from .c_code import CMatrixGenerator
+from .c_code import CMatrixGenerator, _CLUsolveGenerator
 from ..utils import wrap_and_indent
 
 
@@ -25,7 +26,7 @@ cimport cython
 cdef extern from "{prefix}_c.h":
     void evaluate(
 {header_args}
-                 )
+                 ) nogil
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -33,9 +34,10 @@ def eval(
 {python_args}
         ):
 
-    evaluate(
+    with nogil:
+        evaluate(
 {c_args}
-            )
+                )
 
     return (
 {output}
@@ -54,7 +56,8 @@ import numpy
 extension = Extension(name="{prefix}",
                       sources=["{prefix}.pyx",
                                "{prefix}_c.c"],
-                      include_dirs=[numpy.get_include()])
+                      include_dirs=[numpy.get_include()],
+                      extra_compile_args={extra_compile_args})
 
 setup(name="{prefix}",
       ext_modules=cythonize([extension]))\
@@ -62,7 +65,10 @@ setup(name="{prefix}",
 
     _module_counter = 0
 
-    def __init__(self, arguments, matrices, prefix='pydy_codegen', cse=True):
+    _c_matrix_generator_class = CMatrixGenerator
+
+    def __init__(self, arguments, matrices, prefix='pydy_codegen', cse=True,
+                 extra_compile_args=None):
         """
 
         Parameters
@@ -81,16 +87,27 @@ setup(name="{prefix}",
             The desired prefix for the generated files.
         cse : boolean
             Find and replace common sub-expressions in ``matrices`` if True.
+            The sub-expressions are found across all of the matrices at
+            once, so terms shared by the matrices are only computed once.
+        extra_compile_args : sequence of strings, optional
+            Additional arguments passed to the C compiler when the extension
+            is built, e.g. ``['-O3', '-march=native']`` to let the compiler
+            optimize the generated code for the host machine. These are
+            compiler specific.
 
         """
 
         self.prefix = prefix
+        if extra_compile_args is None:
+            self.extra_compile_args = []
+        else:
+            self.extra_compile_args = list(extra_compile_args)
         self.matrices = matrices
         self.arguments = arguments
         self.num_matrices = len(matrices)
         self.num_arguments = len(arguments)
-        self.c_matrix_generator = CMatrixGenerator(arguments, matrices,
-                                                   cse=cse)
+        self.c_matrix_generator = self._c_matrix_generator_class(
+            arguments, matrices, cse=cse)
 
         self._generate_code_blocks()
 
@@ -99,20 +116,25 @@ setup(name="{prefix}",
         lines = defaultdict(list)
 
         hd = 'double* {}_{},'
-        py = "np.ndarray[np.double_t, ndim=1, mode='c'] {}_{},"
-        c = '<double*> {}_{}.data,'
+        # The inputs are only read, so they are taken as C contiguous typed
+        # memoryviews, which are cheaper to acquire than ndarray buffers. The
+        # outputs are returned, so they remain ndarrays.
+        py_in = 'const double[::1] {}_{},'
+        py_out = "np.ndarray[np.double_t, ndim=1, mode='c'] {}_{},"
+        c_in = '<double*> &{}_{}[0],'
+        c_out = '<double*> {}_{}.data,'
         out = 'output_{}.reshape({}, {}),'
         out_vec = 'output_{},'
 
         for i in range(self.num_arguments):
             lines['header_args'].append(hd.format('input', i))
-            lines['python_args'].append(py.format('input', i))
-            lines['c_args'].append(c.format('input', i))
+            lines['python_args'].append(py_in.format('input', i))
+            lines['c_args'].append(c_in.format('input', i))
 
         for i, matrix in enumerate(self.matrices):
             lines['header_args'].append(hd.format('output', i))
-            lines['python_args'].append(py.format('output', i))
-            lines['c_args'].append(c.format('output', i))
+            lines['python_args'].append(py_out.format('output', i))
+            lines['c_args'].append(c_out.format('output', i))
             nr, nc = matrix.shape
             if nc == 1:
                 lines['output'].append(out_vec.format(i))
@@ -121,7 +143,7 @@ setup(name="{prefix}",
 
         indents = {'header_args': 18,
                    'python_args': 9,
-                   'c_args': 13,
+                   'c_args': 17,
                    'output': 12}
 
         self.code_blocks = {k: wrap_and_indent(v, indents[k])[:-1] for k, v
@@ -151,7 +173,8 @@ setup(name="{prefix}",
         c_header, c_source = self.c_matrix_generator.doprint(
             prefix=self.prefix + '_c')
 
-        filling = {'prefix': self.prefix}
+        filling = {'prefix': self.prefix,
+                   'extra_compile_args': repr(self.extra_compile_args)}
         filling.update(self.code_blocks)
 
         cython_source = self._pyx_template.format(**filling)
@@ -161,7 +184,8 @@ setup(name="{prefix}",
 
     def write(self, path=None):
         """Writes the four source files needed to compile the Cython
-        function to the current working directory.
+        function to the current working directory. All of the files are
+        written from a single call to ``doprint``.
 
         Parameters
         ==========
@@ -174,10 +198,14 @@ setup(name="{prefix}",
         if path is None:
             path = os.getcwd()
 
-        self.c_matrix_generator.write(self.prefix + '_c')
-
         setup_py, pyx, c_header, c_source = self.doprint()
 
+        with open(os.path.join(path, self.prefix + '_c.h'), 'w') as f:
+            f.write(c_header)
+
+        with open(os.path.join(path, self.prefix + '_c.c'), 'w') as f:
+            f.write(c_source)
+
         with open(os.path.join(path, self.prefix + '_setup.py'), 'w') as f:
             f.write(setup_py)
 
@@ -185,13 +213,18 @@ setup(name="{prefix}",
             f.write(pyx)
 
     def compile(self, tmp_dir=None, verbose=False):
-        """Returns a function which evaluates the matrices.
+        """Returns a function which evaluates the matrices. The function
+        releases the GIL while the C code runs and fills the output arrays
+        passed to it, so concurrent calls must not share output arrays.
 
         Parameters
         ==========
         tmp_dir : string
             The path to an existing or non-existing directory where all of
-            the generated files will be stored.
+            the generated files will be stored. The module name is derived
+            from a hash of the generated source, so a module previously
+            compiled in this directory from identical source is imported
+            instead of being compiled again.
         verbose : boolean
             If true the output of the completed compilation steps will be
             printed.
@@ -202,27 +235,42 @@ setup(name="{prefix}",
 
         if tmp_dir is None:
             codedir = tempfile.mkdtemp(".pydy_compile")
+            self.prefix = '{}_{}'.format(base_prefix,
+                                         CythonMatrixGenerator._module_counter)
         else:
             codedir = os.path.abspath(tmp_dir)
+            source_hash = hashlib.sha1(
+                ''.join(self.doprint()).encode('utf-8')).hexdigest()
+            self.prefix = '{}_{}'.format(base_prefix, source_hash[:16])
 
         if not os.path.exists(codedir):
             os.makedirs(codedir)
 
-        self.prefix = '{}_{}'.format(base_prefix,
-                                     CythonMatrixGenerator._module_counter)
-
         workingdir = os.getcwd()
         os.chdir(codedir)
 
         try:
             sys.path.append(codedir)
-            self.write()
-            cmd = [sys.executable, self.prefix + '_setup.py', 'build_ext',
-                   '--inplace']
-            output = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            if verbose:
-                print(output.decode())
-            cython_module = importlib.import_module(self.prefix)
+            cython_module = None
+            if tmp_dir is not None:
+                try:
+                    cython_module = importlib.import_module(self.prefix)
+                except Exception:
+                    # Missing or stale, e.g. built against another NumPy, so
+                    # fall through and rebuild it.
+                    pass
+            if cython_module is None:
+                self.write()
+                cmd = [sys.executable, self.prefix + '_setup.py', 'build_ext',
+                       '--inplace']
+                output = subprocess.check_output(cmd,
+                                                 stderr=subprocess.STDOUT)
+                if verbose:
+                    print(output.decode())
+                # NOTE : Python 2.7 has no import path caches to invalidate.
+                if hasattr(importlib, 'invalidate_caches'):
+                    importlib.invalidate_caches()
+                cython_module = importlib.import_module(self.prefix)
         except:
             raise Exception('Failed to compile and import Cython module.')
         finally:
@@ -240,3 +288,12 @@ setup(name="{prefix}",
         self.prefix = base_prefix
 
         return getattr(cython_module, 'eval')
+
+
+class _CythonLUsolveGenerator(CythonMatrixGenerator):
+    """This is a private undocumented class that supports the
+    ``linear_sys_solver='sympy'`` option in CythonODEFunctionGenerator. It
+    wraps a _CLUsolveGenerator directly, so the matrices are only cse'd by
+    the generator whose code is actually compiled."""
+
+    _c_matrix_generator_class = _CLUsolveGenerator
@@ -51,7 +51,9 @@ class MatrixGenerator(object):
             # manually compute them instead of calling:
             # required_args |= matrix.free_symbols
             required_args |= set().union(*[i.free_symbols for i in matrix])
-            required_args |= find_dynamicsymbols(matrix)
+            # NOTE : Immutable matrices are hashable, so the search is cached
+            # for any other generator created from the same matrices.
+            required_args |= find_dynamicsymbols(sm.ImmutableMatrix(matrix))
 
         required_args.remove(me.dynamicsymbols._t)
 
@@ -11,15 +11,16 @@ import numpy as np
 import numpy.linalg
 import scipy.linalg
 import sympy as sm
-import sympy.physics.mechanics as me
 from sympy.core.function import UndefinedFunction, Derivative
 Cython = sm.external.import_module('Cython')
 theano = sm.external.import_module('theano')
+numba = sm.external.import_module('numba')
 if theano:
     from sympy.printing.theanocode import theano_function
 
-from .c_code import _CLUsolveGenerator
-from .cython_code import CythonMatrixGenerator
+from .c_code import _cse_symbolic_lusolve
+from .cython_code import CythonMatrixGenerator, _CythonLUsolveGenerator
+from ..utils import sympy_equal_to_or_newer_than
 
 
 class ODEFunctionGenerator(object):
@@ -243,6 +244,9 @@ r : dictionary
             linear system Ax=b with the call signature x = solve(A, b). For
             example, if you need to use custom kwargs for the SciPy solver,
             pass in a lambda function that wraps the solver and sets them.
+            Specify `sympy` to solve the linear system symbolically before
+            code generation; this is supported by the cython, lambdify, and
+            numba generators.
         constants_arg_type : string
             The generated function accepts two different types of arguments
             for the numerical values of the constants: either a ndarray of
@@ -302,6 +306,14 @@ r : dictionary
         else:
             self.num_specifieds = len(specifieds)
 
+        # Maps each specified to its index in the specifieds array so that a
+        # specifieds dictionary can be unpacked without searching the
+        # sequence at every rhs() evaluation.
+        self._specifieds_index_map = {}
+        if self.specifieds is not None:
+            for i, specified in enumerate(self.specifieds):
+                self._specifieds_index_map[specified] = i
+
         # These are pre-allocated storage for the numerical values used in
         # some of the rhs() evaluations.
         self._constants_values = np.empty(self.num_constants)
@@ -405,7 +417,7 @@ r : dictionary
             if (isinstance(type(k), UndefinedFunction) or
                 isinstance(k, Derivative)):
                 k = (k,)
-            idx = [self.specifieds.index(symmy) for symmy in k]
+            idx = [self._specifieds_index_map[symmy] for symmy in k]
             try:
                 self._specifieds_values[idx] = v(x, t)
             except TypeError:  # not callable
@@ -636,6 +648,7 @@ class CythonODEFunctionGenerator(ODEFunctionGenerator):
                          'prefix': 'pydy_codegen',
                          'cse': True,
                          'verbose': False,
+                         'extra_compile_args': None,
                          }
         for k, v in self._options.items():
             self._options[k] = kwargs.pop(k, v)
@@ -648,9 +661,10 @@ class CythonODEFunctionGenerator(ODEFunctionGenerator):
     __init__.__doc__ = ODEFunctionGenerator.__init__.__doc__
 
     def _cythonize(self, outputs, inputs):
-        g = CythonMatrixGenerator(inputs, outputs,
-                                  prefix=self._options['prefix'],
-                                  cse=self._options['cse'])
+        g = CythonMatrixGenerator(
+            inputs, outputs, prefix=self._options['prefix'],
+            cse=self._options['cse'],
+            extra_compile_args=self._options['extra_compile_args'])
         return g.compile(tmp_dir=self._options['tmp_dir'],
                          verbose=self._options['verbose'])
 
@@ -658,16 +672,17 @@ class CythonODEFunctionGenerator(ODEFunctionGenerator):
         if not self._options['cse']:
             msg = 'cse has to be True if using the sympy linear system solver'
             raise ValueError(msg)
-        g = CythonMatrixGenerator(inputs, outputs,
-                                  prefix=self._options['prefix'],
-                                  cse=True)
-        # patch in the special generator
-        g.c_matrix_generator = _CLUsolveGenerator(inputs, outputs)
+        g = _CythonLUsolveGenerator(
+            inputs, outputs, prefix=self._options['prefix'], cse=True,
+            extra_compile_args=self._options['extra_compile_args'])
         return g.compile(tmp_dir=self._options['tmp_dir'],
                          verbose=self._options['verbose'])
 
     def _set_eval_array(self, f):
 
+        # NOTE : The compiled function writes into self._empties, which is
+        # shared by all calls, so the generated rhs is not thread-safe even
+        # though the evaluation releases the GIL.
         if self.specifieds is None:
             self.eval_arrays = lambda q, u, p: f(q, u, p, *self._empties)
         else:
@@ -736,15 +751,27 @@ class LambdifyODEFunctionGenerator(ODEFunctionGenerator):
                 subs[sym] = v[i]
             vec_inputs.append(v)
 
-        try:
-            outputs = [me.msubs(output, subs) for output in outputs]
-        except AttributeError:
-            # msubs doesn't exist in SymPy < 0.7.6.
-            outputs = [output.subs(subs) for output in outputs]
+        # The keys are exact sub-trees of the outputs, so a single xreplace
+        # dictionary lookup per node suffices.
+        outputs = [output.xreplace(subs) for output in outputs]
 
         modules = [{'ImmutableMatrix': np.array}, 'numpy']
 
-        return sm.lambdify(vec_inputs, outputs, modules=modules)
+        symbolic_lusolve = (self.linear_sys_solver == 'sympy' and
+                            self.system_type != 'full rhs')
+
+        # SymPy >= 1.9 can find the common subexpressions shared by all of
+        # the outputs so that the generated function evaluates them once.
+        if sympy_equal_to_or_newer_than('1.9'):
+            if symbolic_lusolve:
+                cse = _cse_symbolic_lusolve
+            else:
+                cse = True
+            return sm.lambdify(vec_inputs, outputs, modules=modules, cse=cse)
+        else:
+            if symbolic_lusolve:
+                outputs[1] = outputs[0].LUsolve(outputs[1])
+            return sm.lambdify(vec_inputs, outputs, modules=modules)
 
     def generate_full_rhs_function(self):
 
@@ -788,6 +815,34 @@ class LambdifyODEFunctionGenerator(ODEFunctionGenerator):
                                                          in f(q, u, r, p)])
 
 
+class NumbaODEFunctionGenerator(LambdifyODEFunctionGenerator):
+
+    def __init__(self, *args, **kwargs):
+
+        if numba is None:
+            raise ImportError('Numba must be installed to use this class.')
+        else:
+            super(NumbaODEFunctionGenerator, self).__init__(*args, **kwargs)
+
+    __init__.__doc__ = ODEFunctionGenerator.__init__.__doc__
+
+    def _lambdify(self, outputs):
+        # Numba can't unify the integer and float elements of an array
+        # literal, so any numerical matrix entries are converted to floats.
+        outputs = [output.applyfunc(lambda e: sm.Float(e) if e.is_Number
+                                    else e) for output in outputs]
+
+        f_jit = numba.njit(
+            super(NumbaODEFunctionGenerator, self)._lambdify(outputs))
+
+        # The compiled function only accepts arrays of floats, e.g. an empty
+        # list of constants can't be typed.
+        def f(*args):
+            return f_jit(*[np.asarray(a, dtype=float) for a in args])
+
+        return f
+
+
 class TheanoODEFunctionGenerator(ODEFunctionGenerator):
 
     def __init__(self, *args, **kwargs):
@@ -797,6 +852,12 @@ class TheanoODEFunctionGenerator(ODEFunctionGenerator):
         else:
             super(TheanoODEFunctionGenerator, self).__init__(*args, **kwargs)
 
+        if (self.linear_sys_solver == 'sympy' and
+                self.system_type != 'full rhs'):
+            msg = ('The sympy linear system solver is not supported by the '
+                   'theano generator.')
+            raise ValueError(msg)
+
     __init__.__doc__ = ODEFunctionGenerator.__init__.__doc__
 
     def define_inputs(self):
@@ -883,7 +944,8 @@ def generate_ode_function(*args, **kwargs):
 
     generators = {'lambdify': LambdifyODEFunctionGenerator,
                   'cython': CythonODEFunctionGenerator,
-                  'theano': TheanoODEFunctionGenerator}
+                  'theano': TheanoODEFunctionGenerator,
+                  'numba': NumbaODEFunctionGenerator}
 
     generator = kwargs.pop('generator', 'lambdify')
 
@@ -909,7 +971,7 @@ _extra_parameters_doc = \
 """\
         generator : string or and ODEFunctionGenerator, optional
             The method used for generating the numeric right hand side. The
-            string options are {'lambdify'|'theano'|'cython'} with
+            string options are {'lambdify'|'theano'|'cython'|'numba'} with
             'lambdify' being the default. You can also pass in a custom
             subclass of ODEFunctionGenerator.
 
@@ -917,6 +979,9 @@ _extra_parameters_doc = \
         =======
         rhs : function
             A function which evaluates the derivaties of the states. See the
-            function's docstring for more details after generation.
+            function's docstring for more details after generation. The
+            function reuses preallocated arrays between calls, so it is not
+            thread-safe; generate a separate function for each thread that
+            needs one.
 """
 generate_ode_function.__doc__ = ('' * 4 + _docstr + _extra_parameters_doc)
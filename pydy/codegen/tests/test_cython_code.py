@@ -1,13 +1,15 @@
 #!/usr/bin/env python
 
 import os
+import shutil
+import tempfile
 
 import numpy as np
 import sympy as sm
 
 from ...models import multi_mass_spring_damper
 from ..c_code import _CLUsolveGenerator
-from ..cython_code import CythonMatrixGenerator
+from ..cython_code import CythonMatrixGenerator, _CythonLUsolveGenerator
 
 
 class TestCythonMatrixGenerator(object):
@@ -45,22 +47,22 @@ class TestCythonMatrixGenerator(object):
 
         expected['python_args'] = \
 """\
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_0,
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_1,
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_2,
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_3,
+         const double[::1] input_0,
+         const double[::1] input_1,
+         const double[::1] input_2,
+         const double[::1] input_3,
          np.ndarray[np.double_t, ndim=1, mode='c'] output_0,
          np.ndarray[np.double_t, ndim=1, mode='c'] output_1\
 """
 
         expected['c_args'] = \
 """\
-             <double*> input_0.data,
-             <double*> input_1.data,
-             <double*> input_2.data,
-             <double*> input_3.data,
-             <double*> output_0.data,
-             <double*> output_1.data\
+                 <double*> &input_0[0],
+                 <double*> &input_1[0],
+                 <double*> &input_2[0],
+                 <double*> &input_3[0],
+                 <double*> output_0.data,
+                 <double*> output_1.data\
 """
 
         expected['output'] = \
@@ -90,27 +92,28 @@ cdef extern from "boogly_bee_c.h":
                   double* input_3,
                   double* output_0,
                   double* output_1
-                 )
+                 ) nogil
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def eval(
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_0,
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_1,
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_2,
-         np.ndarray[np.double_t, ndim=1, mode='c'] input_3,
+         const double[::1] input_0,
+         const double[::1] input_1,
+         const double[::1] input_2,
+         const double[::1] input_3,
          np.ndarray[np.double_t, ndim=1, mode='c'] output_0,
          np.ndarray[np.double_t, ndim=1, mode='c'] output_1
         ):
 
-    evaluate(
-             <double*> input_0.data,
-             <double*> input_1.data,
-             <double*> input_2.data,
-             <double*> input_3.data,
-             <double*> output_0.data,
-             <double*> output_1.data
-            )
+    with nogil:
+        evaluate(
+                 <double*> &input_0[0],
+                 <double*> &input_1[0],
+                 <double*> &input_2[0],
+                 <double*> &input_3[0],
+                 <double*> output_0.data,
+                 <double*> output_1.data
+                )
 
     return (
             output_0.reshape(6, 6),
@@ -130,7 +133,8 @@ import numpy
 extension = Extension(name="boogly_bee",
                       sources=["boogly_bee.pyx",
                                "boogly_bee_c.c"],
-                      include_dirs=[numpy.get_include()])
+                      include_dirs=[numpy.get_include()],
+                      extra_compile_args=[])
 
 setup(name="boogly_bee",
       ext_modules=cythonize([extension]))\
@@ -141,6 +145,16 @@ setup(name="boogly_bee",
         assert setup == expected_setup_py_source
         assert pyx == expected_pyx_source
 
+    def test_extra_compile_args(self):
+
+        generator = CythonMatrixGenerator(self.arguments, self.matrices,
+                                          self.prefix,
+                                          extra_compile_args=('-O3',))
+
+        setup, pyx, c_header, c_source = generator.doprint()
+
+        assert "extra_compile_args=['-O3'])" in setup
+
     def test_write(self):
 
         setup, pyx, c_header, c_source = self.generator.doprint()
@@ -159,6 +173,19 @@ setup(name="boogly_bee",
         with open(self.prefix + '.pyx') as f:
             assert f.read() == pyx
 
+    def test_write_path(self):
+
+        tmp_dir = tempfile.mkdtemp()
+
+        try:
+            self.generator.write(path=tmp_dir)
+            for suffix in ['_c.h', '_c.c', '_setup.py', '.pyx']:
+                assert os.path.isfile(os.path.join(tmp_dir,
+                                                   self.prefix + suffix))
+                assert not os.path.isfile(self.prefix + suffix)
+        finally:
+            shutil.rmtree(tmp_dir)
+
     def test_compile(self):
 
         f = self.generator.compile()
@@ -209,9 +236,8 @@ def test_lusolve_generator():
                sys.eom_method.forcing,  # b
                sys.eom_method.forcing]
 
-    generator = CythonMatrixGenerator(arguments, outputs)
-    # patch in the special generator
-    generator.c_matrix_generator = _CLUsolveGenerator(arguments, outputs)
+    generator = _CythonLUsolveGenerator(arguments, outputs)
+    assert isinstance(generator.c_matrix_generator, _CLUsolveGenerator)
     func = generator.compile()
 
     # setup the input and output arrays
@@ -242,3 +268,34 @@ def test_lusolve_generator():
     np.testing.assert_allclose(x_vals,
                                np.linalg.solve(M_vals.reshape((nr, nc)),
                                                F_vals))
+
+
+def test_compile_reuses_module_in_tmp_dir():
+
+    sys = multi_mass_spring_damper(2)
+
+    arguments = (sys.constants_symbols, sys.coordinates, sys.speeds)
+    matrices = (sys.eom_method.mass_matrix, sys.eom_method.forcing)
+
+    tmp_dir = tempfile.mkdtemp()
+
+    try:
+        generator = CythonMatrixGenerator(arguments, matrices)
+        generator.compile(tmp_dir=tmp_dir)
+        pyx_files = [n for n in os.listdir(tmp_dir) if n.endswith('.pyx')]
+        assert len(pyx_files) == 1
+        mtime = os.path.getmtime(os.path.join(tmp_dir, pyx_files[0]))
+
+        generator = CythonMatrixGenerator(arguments, matrices)
+        f = generator.compile(tmp_dir=tmp_dir)
+        assert [n for n in os.listdir(tmp_dir) if n.endswith('.pyx')] == \
+            pyx_files
+        assert os.path.getmtime(os.path.join(tmp_dir, pyx_files[0])) == mtime
+        assert generator.prefix == 'pydy_codegen'
+
+        args = [np.random.random(len(a)) for a in arguments]
+        M, F = f(*(args + [np.empty(4), np.empty(2)]))
+        assert M.shape == (2, 2)
+        assert F.shape == (2,)
+    finally:
+        shutil.rmtree(tmp_dir)
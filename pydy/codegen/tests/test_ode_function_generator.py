@@ -10,11 +10,13 @@ from pydy.codegen.ode_function_generators import generate_ode_function
 
 Cython = sm.external.import_module('Cython')
 theano = sm.external.import_module('theano')
+numba = sm.external.import_module('numba')
 
 from ... import models
 from ..ode_function_generators import (ODEFunctionGenerator,
                                        LambdifyODEFunctionGenerator,
                                        CythonODEFunctionGenerator,
+                                       NumbaODEFunctionGenerator,
                                        TheanoODEFunctionGenerator)
 
 from ...utils import PyDyImportWarning
@@ -89,6 +91,73 @@ def test_symbolic_lusolve_min_mass_matrix():
                                rhs_symbolic_solve(x, t, p))
 
 
+def test_symbolic_lusolve_lambdify():
+    sys = models.n_link_pendulum_on_cart(n=3, cart_force=False,
+                                         joint_torques=False)
+
+    x = np.random.random(len(sys.states))
+    t = 5.125
+    p = np.random.random(len(sys.constants_symbols))
+
+    results = []
+    for solver in ['sympy', 'numpy']:
+        g = LambdifyODEFunctionGenerator(
+            sys.eom_method.forcing_full,
+            sys.coordinates,
+            sys.speeds,
+            sys.constants_symbols,
+            mass_matrix=sys.eom_method.mass_matrix_full,
+            linear_sys_solver=solver)
+        results.append(g.generate()(x, t, p))
+
+    np.testing.assert_allclose(*results)
+
+
+def test_symbolic_lusolve_lambdify_min_mass_matrix():
+    sys = models.n_link_pendulum_on_cart(n=3, cart_force=False,
+                                         joint_torques=False)
+    kin_diff_eqs = sys.eom_method.kindiffdict()
+    coord_derivs = sm.Matrix([kin_diff_eqs[c.diff()] for c in
+                              sys.coordinates])
+
+    x = np.random.random(len(sys.states))
+    t = 5.125
+    p = np.random.random(len(sys.constants_symbols))
+
+    results = []
+    for solver in ['sympy', 'numpy']:
+        g = LambdifyODEFunctionGenerator(
+            sys.eom_method.forcing,
+            sys.coordinates,
+            sys.speeds,
+            sys.constants_symbols,
+            mass_matrix=sys.eom_method.mass_matrix,
+            coordinate_derivatives=coord_derivs,
+            linear_sys_solver=solver)
+        results.append(g.generate()(x, t, p))
+
+    np.testing.assert_allclose(*results)
+
+
+def test_symbolic_lusolve_theano():
+
+    if not theano:
+        warnings.warn("Theano was not found so the related tests are being"
+                      " skipped.", PyDyImportWarning)
+        return
+
+    sys = models.n_link_pendulum_on_cart(n=1, cart_force=False,
+                                         joint_torques=False)
+
+    with np.testing.assert_raises(ValueError):
+        TheanoODEFunctionGenerator(sys.eom_method.forcing_full,
+                                   sys.coordinates,
+                                   sys.speeds,
+                                   sys.constants_symbols,
+                                   mass_matrix=sys.eom_method.mass_matrix_full,
+                                   linear_sys_solver='sympy')
+
+
 def test_cse_same_numerical_results():
     # NOTE : This ensurses that the same results are always given for the sympy
     # cse outputs, which seem to change every version.
@@ -251,6 +320,12 @@ class TestODEFunctionGeneratorSubclasses(object):
         warnings.warn("Theano was not found so the related tests are being"
                       " skipped.", PyDyImportWarning)
 
+    if numba:
+        ode_function_subclasses.append(NumbaODEFunctionGenerator)
+    else:
+        warnings.warn("Numba was not found so the related tests are being"
+                      " skipped.", PyDyImportWarning)
+
     def setup(self):
 
         self.sys = models.multi_mass_spring_damper()
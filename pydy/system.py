@@ -54,11 +54,11 @@ from itertools import repeat
 import numpy as np
 import sympy as sm
 from sympy.physics.mechanics import dynamicsymbols
-from sympy.physics.mechanics.functions import find_dynamicsymbols
 from scipy.integrate import odeint
 
 from .codegen.ode_function_generators import generate_ode_function
-from .utils import PyDyFutureWarning
+from .utils import (PyDyFutureWarning, PyDyUserWarning,
+                    find_dynamicsymbols)
 
 SYMPY_VERSION = sm.__version__
 
@@ -99,6 +99,11 @@ class System(object):
 
         self._eom_method = eom_method
 
+        # NOTE : KanesMethod builds these matrices each time they are
+        # accessed, so they are computed once here. eom_method is read-only.
+        self._mass_matrix_full = eom_method.mass_matrix_full
+        self._forcing_full = eom_method.forcing_full
+
         # TODO : What if user adds symbols after constructing a System?
         self._constants_symbols = self._Kane_constant_symbols()
         self._specifieds_symbols = self._Kane_undefined_dynamicsymbols()
@@ -420,7 +425,7 @@ class System(object):
 
         """
 
-        args = (self.eom_method.forcing_full,
+        args = (self._forcing_full,
                 self.coordinates,
                 self.speeds,
                 self.constants_symbols)
@@ -443,7 +448,7 @@ class System(object):
         if not specifieds:
             specifieds = None
 
-        kwargs = {'mass_matrix': self.eom_method.mass_matrix_full,
+        kwargs = {'mass_matrix': self._mass_matrix_full,
                   'specifieds': specifieds}
 
         return kwargs
@@ -470,11 +475,13 @@ class System(object):
 
         if 'specified' in kwargs:
             kwargs.pop('specified')
-            print("User supplied 'specified' kwarg was disregarded.")
+            warnings.warn("User supplied 'specified' kwarg was disregarded.",
+                          PyDyUserWarning)
 
         if 'specifieds' in kwargs:
             kwargs.pop('specifieds')
-            print("User supplied 'specifieds' kwarg was disregarded.")
+            warnings.warn("User supplied 'specifieds' kwarg was disregarded.",
+                          PyDyUserWarning)
 
         kwargs.update(self._kwargs_for_gen_ode_func())
 
@@ -564,8 +571,7 @@ class System(object):
                      list(self.eom_method._udot[:]) +
                      list(uaux) + list(uauxdot))
 
-        inlist = (self.eom_method.forcing_full[:] +
-                  self.eom_method.mass_matrix_full[:])
+        inlist = self._forcing_full[:] + self._mass_matrix_full[:]
 
         return inlist, insyms
 
@@ -580,8 +586,10 @@ class System(object):
         from_eoms, from_sym_lists = self._Kane_inlist_insyms()
         functions_of_time = set()
         for expr in from_eoms:
-            functions_of_time = functions_of_time.union(
-                find_dynamicsymbols(expr))
+            # NOTE : find_dynamicsymbols caches its result per expression, so
+            # repeated checks of the same equations of motion do not walk the
+            # expression trees again.
+            functions_of_time.update(find_dynamicsymbols(expr))
         return functions_of_time.difference(from_sym_lists)
 
     def _Kane_constant_symbols(self):
@@ -596,7 +604,7 @@ class System(object):
         from_eoms, from_sym_lists = self._Kane_inlist_insyms()
         unique_symbols = set()
         for expr in from_eoms:
-            unique_symbols = unique_symbols.union(expr.free_symbols)
+            unique_symbols.update(expr.free_symbols)
         constants = unique_symbols
         constants.remove(dynamicsymbols._t)
         return constants
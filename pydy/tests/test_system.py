@@ -12,10 +12,11 @@ import sympy.physics.mechanics as me
 from scipy.integrate import odeint
 theano = sm.external.import_module('theano')
 Cython = sm.external.import_module('Cython')
+numba = sm.external.import_module('numba')
 
 from ..system import System
 from ..models import multi_mass_spring_damper, n_link_pendulum_on_cart
-from ..utils import PyDyImportWarning, sympy_newer_than
+from ..utils import PyDyImportWarning, PyDyUserWarning, sympy_newer_than
 
 SYMPY_VERSION = sm.__version__
 
@@ -414,12 +415,28 @@ class TestSystem():
             warnings.warn("Theano was not found so the related tests are being"
                           " skipped.", PyDyImportWarning)
 
+        if numba:
+            sys.generate_ode_function(generator='numba')
+            x_07 = sys.integrate()
+            testing.assert_allclose(x_04, x_07)
+        else:
+            warnings.warn("Numba was not found so the related tests are being"
+                          " skipped.", PyDyImportWarning)
+
         # Unrecognized generator.
         # -----------------------
         sys = System(self.kane, times=times)
         with testing.assert_raises(NotImplementedError):
             sys.generate_ode_function(generator='made-up')
 
+        # User supplied specifieds are disregarded with a warning.
+        # --------------------------------------------------------
+        sys = System(self.kane, times=times)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            sys.generate_ode_function(specifieds=None)
+        assert [True for wi in w if issubclass(wi.category, PyDyUserWarning)]
+
         # Test pass kwargs to the generators.
         if Cython:
             self.tempdirpath = tempfile.mkdtemp()
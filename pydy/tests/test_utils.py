@@ -4,10 +4,11 @@ from pkg_resources import parse_version
 from setuptools import __version__ as SETUPTOOLS_VERSION
 from nose.tools import assert_raises
 
-from sympy import cos, sin, tan, sqrt, Matrix
+from sympy import cos, sin, tan, sqrt, Matrix, ImmutableMatrix
 from sympy.physics.mechanics import dynamicsymbols
 
-from ..utils import sympy_equal_to_or_newer_than, wrap_and_indent
+from ..utils import (sympy_equal_to_or_newer_than, wrap_and_indent,
+                     find_dynamicsymbols)
 from ..codegen.cython_code import CythonMatrixGenerator
 
 
@@ -73,3 +74,23 @@ def test_wrap_and_indent():
     % + c + d
     % + e"""
     assert wrapped == expected
+
+
+def test_find_dynamicsymbols():
+
+    x, y = dynamicsymbols('x, y')
+    expr = Matrix([x + x.diff()*y, cos(y)])
+
+    expected = set([x, y, x.diff()])
+    assert find_dynamicsymbols(expr) == expected
+    assert find_dynamicsymbols(expr, [x, y]) == set([x.diff()])
+
+    # The cached search of an immutable matrix must hand back a new set each
+    # time, so that mutating the result does not corrupt the cache.
+    imm_expr = ImmutableMatrix(expr)
+    found = find_dynamicsymbols(imm_expr)
+    found.remove(x)
+    assert find_dynamicsymbols(imm_expr) == expected
+
+    with assert_raises(TypeError):
+        find_dynamicsymbols(expr, x)
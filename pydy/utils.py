@@ -6,6 +6,7 @@ import textwrap
 from pkg_resources import parse_version
 from setuptools import __version__ as SETUPTOOLS_VERSION
 import sympy as sm
+from sympy.core.cache import cacheit
 from sympy.core.function import AppliedUndef
 from sympy.utilities.iterables import iterable
 from sympy.physics.mechanics import dynamicsymbols
@@ -114,7 +115,6 @@ def find_dynamicsymbols(expression, exclude=None):
     >>> find_dynamicsymbols(expr, [x, y])
     set([Derivative(x(t), t)])
     """
-    t_set = set([dynamicsymbols._t])
     if exclude:
         if iterable(exclude):
             exclude_set = set(exclude)
@@ -122,8 +122,17 @@ def find_dynamicsymbols(expression, exclude=None):
             raise TypeError("exclude kwarg must be iterable")
     else:
         exclude_set = set()
-    return set([i for i in expression.atoms(AppliedUndef, sm.Derivative) if
-                i.free_symbols == t_set]) - exclude_set
+    return set(_find_dynamicsymbols(expression)) - exclude_set
+
+
+@cacheit
+def _find_dynamicsymbols(expression):
+    """Returns a frozenset of the dynamicsymbols in expression. The result
+    is stored in SymPy's cache, so an immutable expression tree is only
+    walked once no matter how many times it is searched."""
+    t_set = set([dynamicsymbols._t])
+    return frozenset([i for i in expression.atoms(AppliedUndef, sm.Derivative)
+                      if i.free_symbols == t_set])
 
 
 class PyDyDeprecationWarning(DeprecationWarning):
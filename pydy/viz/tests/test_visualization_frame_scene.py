@@ -246,6 +246,31 @@ class TestVisualizationFrameScene(object):
             self.global_frame2._track.name == 'scene/booger.matrix'
             assert_allclose(self.global_frame2._track.times, times)
 
+    def test_numeric_transform_reuse(self):
+
+        self.global_frame1.generate_transformation_matrix(
+            self.inertial_ref_frame, self.origin)
+        f1 = self.global_frame1.generate_numeric_transform_function(
+            self.dynamic, self.parameters)
+
+        # Nothing symbolic has changed, so the function is not regenerated.
+        self.global_frame1.generate_transformation_matrix(
+            self.inertial_ref_frame, self.origin)
+        f2 = self.global_frame1.generate_numeric_transform_function(
+            self.dynamic, self.parameters)
+        assert f2 is f1
+
+        # A different point changes the transformation matrix.
+        self.global_frame1.generate_transformation_matrix(
+            self.inertial_ref_frame, self.P1)
+        f3 = self.global_frame1.generate_numeric_transform_function(
+            self.dynamic, self.parameters)
+        assert f3 is not f1
+
+        f4 = self.global_frame1.generate_numeric_transform_function(
+            self.dynamic, self.parameters[:-1])
+        assert f4 is not f3
+
     def test_perspective_camera(self):
 
         # Camera is a subclass of VisualizationFrame, but without any specific
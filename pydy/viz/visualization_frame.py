@@ -6,7 +6,7 @@ if sys.version_info < (3, 0):
 else:
     from collections.abc import Iterator
 import numpy as np
-from sympy import Dummy, lambdify
+from sympy import Dummy, ImmutableMatrix, lambdify
 from sympy.matrices.expressions import Identity
 from sympy.physics.mechanics import Point, ReferenceFrame
 try:
@@ -265,30 +265,42 @@ class VisualizationFrame(object):
 
         Returns
         =======
-        numeric_transform : list of functions
-            A list of functions which return the numerical transformation
-            for each element in the transformation matrix.
+        numeric_transform : function
+            A function which returns a list of the numerical values of the
+            16 elements in the transformation matrix.
 
         """
 
+        constant_variables = list(constant_variables)
+
+        # Lambdifying is expensive, so the numeric function is reused if the
+        # symbolic transformation and its arguments are unchanged since the
+        # last call, e.g. when a scene is regenerated for new numerical
+        # values.
+        key = (ImmutableMatrix(self._transform), tuple(dynamic_variables),
+               tuple(constant_variables))
+        if key == getattr(self, '_numeric_transform_key', None):
+            return self._numeric_transform
+
         dummy_symbols = [Dummy() for i in dynamic_variables]
         dummy_dict = dict(zip(dynamic_variables, dummy_symbols))
-        transform = self._transform.subs(dummy_dict).reshape(16, 1)
+        transform = self._transform.xreplace(dummy_dict).reshape(16, 1)
         dummy_symbols.extend(constant_variables)
 
-        # Create a numeric transformation for each element in the transformation
-        # matrix. We cannot lambdify the transformation matrix as calling
-        # lambdify of a constant expression returns a scalar, even if the
-        # lambdify function arguments are sequences:
+        # Create a single numeric function for all of the elements in the
+        # transformation matrix, so that the terms shared by the elements are
+        # only evaluated once. The elements are returned as a list instead of
+        # a matrix, because lambdify of a constant expression returns a
+        # scalar, even if the lambdify function arguments are sequences:
         # https://github.com/sympy/sympy/issues/5642
-        self._numeric_transform = []
-        for i in range(16):
-            t = transform[i]
-            if t.has(Dummy):
-                f = lambdify(dummy_symbols, t, modules='numpy')
-            else:
-                f = lambdify(constant_variables, t, modules='numpy')
-            self._numeric_transform.append(f)
+        # The scalars are broadcast in evaluate_transformation_matrix().
+        if sympy_equal_to_or_newer_than('1.9'):
+            self._numeric_transform = lambdify(dummy_symbols, transform[:],
+                                               modules='numpy', cse=True)
+        else:
+            self._numeric_transform = lambdify(dummy_symbols, transform[:],
+                                               modules='numpy')
+        self._numeric_transform_key = key
         return self._numeric_transform
 
     def evaluate_transformation_matrix(self, dynamic_values, constant_values):
@@ -318,23 +330,15 @@ class VisualizationFrame(object):
             args = []
             for a in np.split(states, states.shape[1], 1):
                 args.append(np.squeeze(a))
-            for a in constant_values:
-                args.append(np.repeat(a, n))
+            # The constants are broadcast against the n time steps.
+            args.extend(constant_values)
         else:
             n = 1
             args = np.hstack((states, constant_values))
 
         new = np.zeros((n, 16))
-        for i, t in enumerate(self._numeric_transform):
-            if callable(t):
-                try:
-                    new[:, i] = t(*args)
-                except TypeError:
-                    # dynamic values are not necessary so pass only constant
-                    # values into transform function
-                    new[:, i] = np.repeat(t(*constant_values), n)
-            else:
-                new[:, i] = np.repeat(t, n)
+        for i, t in enumerate(self._numeric_transform(*args)):
+            new[:, i] = t
         self._visualization_matrix = new.tolist()
         return self._visualization_matrix
 
@@ -469,7 +473,11 @@ class VisualizationFrame(object):
 
         name = "scene/{}.matrix".format(self._mesh.name)
 
-        track = p3js.VectorKeyframeTrack(name=name, times=times,
-                                         values=matrices)
+        # NOTE : The keyframe values are WebGL data too, so they are
+        # converted to 32 bit here instead of being cast with a warning by
+        # pythreejs.
+        track = p3js.VectorKeyframeTrack(
+            name=name, times=times,
+            values=np.asarray(matrices, dtype=np.float32))
 
         self._track = track
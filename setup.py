@@ -26,7 +26,8 @@ else:  # Python 3
                         'sympy>=1.5.1']
     extras_require = {'doc': ['sphinx', 'numpydoc'],
                       'codegen': ['Cython>=0.29.14',
-                                  'Theano>=1.0.4'],
+                                  'Theano>=1.0.4',
+                                  'numba>=0.50.0'],
                       'examples': ['matplotlib>=3.1.2',
                                    'notebook>=4.0.0,<5.0.0',
                                    'ipywidgets>=4.0.0,<5.0.0'],